@@ -1,15 +1,99 @@
 from ccxt.async_support.base.exchange import Exchange
+import aiohttp
+import asyncio
 import hashlib
-import json
+import re
 from typing import Optional, List, Dict, Any
 from ccxt.base.errors import ExchangeError, AuthenticationError, InsufficientFunds, InvalidOrder, OrderNotFound, BadRequest, RateLimitExceeded, NotSupported
 from ccxt.base.types import Order, Balances, Market, Ticker, Tickers, OHLCV
 from ccxt.base.decimal_to_precision import TICK_SIZE
 
+_CLOSED_ORDER_STATUSES = frozenset(['closed', 'canceled', 'failed'])
+_PRECISION_TABLE = tuple(10.0 ** -i for i in range(24))
+# fields shared by every swyftx market, all of which are AUD-quoted spot pairs
+_MARKET_TEMPLATE = {
+    'settle': None,
+    'settleId': None,
+    'type': 'spot',
+    'spot': True,
+    'margin': False,
+    'swap': False,
+    'future': False,
+    'option': False,
+    'contract': False,
+    'linear': None,
+    'inverse': None,
+    'contractSize': None,
+    'expiry': None,
+    'expiryDatetime': None,
+    'strike': None,
+    'optionType': None,
+    'created': None,
+}
+# live-rates only carries prices and the daily change, everything else stays unset
+_TICKER_TEMPLATE = {
+    'timestamp': None,
+    'datetime': None,
+    'high': None,
+    'low': None,
+    'bidVolume': None,
+    'askVolume': None,
+    'vwap': None,
+    'open': None,
+    'previousClose': None,
+    'change': None,
+    'average': None,
+    'baseVolume': None,
+}
+
+
+def _precision_from_scale(scale):
+    if 0 <= scale < len(_PRECISION_TABLE):
+        return _PRECISION_TABLE[scale]
+    return 10 ** (-scale)
+
+
+def _to_string(value):
+    if value is None or value == '':
+        return None
+    return str(value)
+
+
+def _to_integer(value):
+    # same coercion as Exchange.safe_integer
+    if value is None or value == '':
+        return None
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_number(number, value):
+    # same coercion as Exchange.safe_number, honouring the exchange's configured number type
+    if value is None or value == '':
+        return None
+    try:
+        return number(str(value))
+    except Exception:
+        return None
+
+
 class swyftx(Exchange):
     def __init__(self, config={}):
         super().__init__()
         self.access_token = None
+        self._access_token_expires = 0
+        self._auth_lock = None
+        self._compiled_signers = {}
+        self._private_headers = None
+        self._private_headers_token = None
+        self._assets_cache = None
+        self._assets_timestamp = 0
+        self._assets_lock = None
+        self._assets_loaded = False
+        self._id_to_code = {}
+        self._markets_by_base_id = {}
         self.api = {
             'public': {
                 'get': [
@@ -46,6 +130,7 @@ class swyftx(Exchange):
                 'put': ['orders/{orderUuid}'],
             },
         }
+        self._auth_literals, self._auth_patterns = self._compile_auth_patterns()
         self.urls = {
             'api': {
                 'public': 'https://api.swyftx.com.au',
@@ -59,6 +144,10 @@ class swyftx(Exchange):
         self.options = {
             'assetsByCode': None,
             'assetsById': None,
+            'assetsCacheTTL': 300000,  # milliseconds
+            'connectionLimit': 64,
+            'connectionLimitPerHost': 32,
+            'keepAliveTimeout': 75,  # seconds
         }
         self.fees = {
             'trading': {
@@ -99,21 +188,38 @@ class swyftx(Exchange):
         }
         self.precision_mode = TICK_SIZE
         self.update_config(config)
+        self._public_base = None
+        self._sync_public_urls()
+        self._user_agent = f"ccxt/{self.version}"
+        self._public_headers = {
+            'Content-Type': 'application/json',
+            'User-Agent': self._user_agent,
+        }
+
+    def _sync_public_urls(self):
+        # everything public is derived from urls['api']['public'], rebuilt when that host is swapped after construction
+        public_base = self.urls['api']['public']
+        if public_base != self._public_base:
+            self._public_base = public_base
+            self._assets_url = f"{public_base}/markets/assets/"
+            self._aud_live_rates_url = f"{public_base}/live-rates/1/"
+            self._assets_cache = None
+        return public_base
 
     async def fetch_markets(self, params={}) -> List[Market]:
-        assets_url = f"{self.urls['api']['public']}/markets/assets/"
-        assets_response = await self.fetch(assets_url)
+        self._sync_public_urls()
+        # the AUD asset id is fixed, so live rates don't have to wait for the assets response
+        assets_response, live_rates_response = await asyncio.gather(self._fetch_assets(), self.fetch(self._aud_live_rates_url))
+        self._set_asset_mapping(assets_response)
         assets_by_id = self.index_by(assets_response, 'id')
         result = []
         aud_id = '1'
         aud_asset = assets_by_id.get(aud_id)
         if not aud_asset:
             raise ExchangeError(f"{self.id} fetchMarkets() could not find AUD asset")
-        live_rates_url = f"{self.urls['api']['public']}/live-rates/{aud_id}/"
-        live_rates_response = await self.fetch(live_rates_url)
         quote_code = self.safe_currency_code(aud_asset.get('code'))
         price_scale = self.safe_integer(aud_asset, 'price_scale', 6)
-        price_precision = 10 ** (-price_scale)
+        price_precision = _precision_from_scale(price_scale)
         for base_id in live_rates_response.keys():
             if base_id == aud_id:
                 continue
@@ -126,51 +232,41 @@ class swyftx(Exchange):
             base_minimum = self.safe_number(base_asset, 'minimum_order')
             base_min_increment = self.safe_number(base_asset, 'minimum_order_increment')
             base_price_scale = self.safe_integer(base_asset, 'price_scale', 8)
-            amount_precision = base_min_increment or (10 ** (-base_price_scale))
-            buy_liquidity_flag = self.safe_value(rate_info, 'buyLiquidityFlag', False)
-            sell_liquidity_flag = self.safe_value(rate_info, 'sellLiquidityFlag', False)
-            deposit_enabled = self.safe_value(base_asset, 'deposit_enabled', True)
-            withdraw_enabled = self.safe_value(base_asset, 'withdraw_enabled', True)
+            amount_precision = base_min_increment or _precision_from_scale(base_price_scale)
+            buy_liquidity_flag = rate_info.get('buyLiquidityFlag', False)
+            sell_liquidity_flag = rate_info.get('sellLiquidityFlag', False)
+            deposit_enabled = base_asset.get('deposit_enabled', True)
+            withdraw_enabled = base_asset.get('withdraw_enabled', True)
             active = not buy_liquidity_flag and not sell_liquidity_flag and deposit_enabled and withdraw_enabled
-            result.append({
-                'id': f"{base_id}/{aud_id}",
-                'symbol': symbol,
-                'base': base,
-                'quote': quote_code,
-                'settle': None,
-                'baseId': base_id,
-                'quoteId': aud_id,
-                'settleId': None,
-                'type': 'spot',
-                'spot': True,
-                'margin': False,
-                'swap': False,
-                'future': False,
-                'option': False,
-                'active': active,
-                'contract': False,
-                'linear': None,
-                'inverse': None,
-                'contractSize': None,
-                'expiry': None,
-                'expiryDatetime': None,
-                'strike': None,
-                'optionType': None,
-                'precision': {'amount': amount_precision, 'price': price_precision},
-                'limits': {
+            market = _MARKET_TEMPLATE.copy()
+            market.update(
+                id=f"{base_id}/{aud_id}",
+                symbol=symbol,
+                base=base,
+                quote=quote_code,
+                baseId=base_id,
+                quoteId=aud_id,
+                active=active,
+                precision={'amount': amount_precision, 'price': price_precision},
+                limits={
                     'leverage': {'min': None, 'max': None},
                     'amount': {'min': base_minimum, 'max': None},
                     'price': {'min': None, 'max': None},
                     'cost': {'min': None, 'max': None},
                 },
-                'created': None,
-                'info': {'asset': base_asset, 'rate': rate_info},
-            })
+                info={'asset': base_asset, 'rate': rate_info},
+            )
+            result.append(market)
+        return result
+
+    def set_markets(self, markets, currencies=None):
+        result = super().set_markets(markets, currencies)
+        # every market is quoted in AUD, so the base asset id alone identifies it
+        self._markets_by_base_id = {market['baseId']: market for market in self.markets.values() if market.get('quoteId') == '1'}
         return result
 
     async def fetch_currencies(self, params={}) -> Dict:
-        url = f"{self.urls['api']['public']}/markets/assets/"
-        response = await self.fetch(url)
+        response = await self._fetch_assets()
         result = {}
         for currency in response:
             id = self.safe_string(currency, 'id')
@@ -181,7 +277,7 @@ class swyftx(Exchange):
             active = deposit_enabled or withdraw_enabled
             mining_fee = self.safe_number(currency, 'mining_fee')
             price_scale = self.safe_integer(currency, 'price_scale', 8)
-            precision = 10 ** (-price_scale)
+            precision = _precision_from_scale(price_scale)
             min_withdrawal = self.safe_number(currency, 'min_withdrawal')
             minimum_order = self.safe_number(currency, 'minimum_order')
             result[code] = {
@@ -202,11 +298,27 @@ class swyftx(Exchange):
             }
         return result
 
+    async def _fetch_assets(self):
+        # markets/assets backs fetch_markets, fetch_currencies and load_asset_mapping, so share one response between them
+        # created on first use: before python 3.10 a lock binds to the loop current at construction time
+        if self._assets_lock is None:
+            self._assets_lock = asyncio.Lock()
+        async with self._assets_lock:
+            self._sync_public_urls()
+            max_age = self.safe_integer(self.options, 'assetsCacheTTL', 300000)
+            if self._assets_cache is not None and self.milliseconds() - self._assets_timestamp < max_age:
+                return self._assets_cache
+            self._assets_cache = await self.fetch(self._assets_url)
+            self._assets_timestamp = self.milliseconds()
+            return self._assets_cache
+
     async def load_asset_mapping(self):
         if self.options['assetsByCode'] is not None:
             return
-        url = f"{self.urls['api']['public']}/markets/assets/"
-        assets = await self.fetch(url)
+        assets = await self._fetch_assets()
+        self._set_asset_mapping(assets)
+
+    def _set_asset_mapping(self, assets):
         assets_by_code = {}
         assets_by_id = {}
         for asset in assets:
@@ -216,17 +328,39 @@ class swyftx(Exchange):
             assets_by_id[id] = asset
         self.options['assetsByCode'] = assets_by_code
         self.options['assetsById'] = assets_by_id
+        self._id_to_code = {id: self.safe_currency_code(self.safe_string(asset, 'code')) for id, asset in assets_by_id.items()}
+        self._assets_loaded = True
+
+    def _ensure_loaded_sync(self):
+        return bool(self.markets) and self.markets_by_id is not None and self._assets_loaded
 
     async def authenticate(self):
         path = 'auth/refresh/'
         request = {'apiKey': self.api_key}
-        response = await self.fetch(f"{self.urls['api']['public']}/{path}", 'POST', {'Content-Type': 'application/json'}, json.dumps(request))
+        response = await self.fetch(f"{self._sync_public_urls()}/{path}", 'POST', {'Content-Type': 'application/json'}, self.json(request))
         self.access_token = self.safe_string(response, 'accessToken')
+        # refresh 30 seconds ahead of the advertised expiry
+        expires_in = self.safe_integer(response, 'expiresIn', 900)
+        self._access_token_expires = self.milliseconds() + (expires_in - 30) * 1000
         return response
 
+    def _access_token_valid(self):
+        return self.access_token is not None and self.milliseconds() < self._access_token_expires
+
+    async def _ensure_access_token(self):
+        if self._access_token_valid():
+            return
+        # concurrent requests wait for the one refresh in flight instead of each authenticating
+        if self._auth_lock is None:
+            self._auth_lock = asyncio.Lock()
+        async with self._auth_lock:
+            if not self._access_token_valid():
+                await self.authenticate()
+
     async def fetch_balance(self, params={}) -> Balances:
-        await self.load_markets()
-        await self.load_asset_mapping()
+        if not self._ensure_loaded_sync():
+            await self.load_markets()
+            await self.load_asset_mapping()
         path = 'user/balance/'
         signed = self.sign(path, 'private', 'GET', params)
         response = await self.fetch(signed['url'], signed['method'], signed['headers'], signed['body'])
@@ -234,20 +368,18 @@ class swyftx(Exchange):
 
     def parse_balance(self, response) -> Balances:
         result = {'info': response}
-        assets_by_id = self.safe_value(self.options, 'assetsById', {})
+        id_to_code = self._id_to_code
+        template = self.account()
         for balance in response:
             asset_id = self.safe_string(balance, 'assetId')
             available_balance = self.safe_string(balance, 'availableBalance')
-            code = asset_id
-            asset = assets_by_id.get(asset_id)
-            if asset:
-                code = self.safe_currency_code(self.safe_string(asset, 'code'))
-            else:
-                market_id = f"{asset_id}/1"
-                market = self.safe_value(self.markets_by_id, market_id)
+            code = id_to_code.get(asset_id)
+            if code is None:
+                code = asset_id
+                market = self._markets_by_base_id.get(asset_id)
                 if market:
                     code = market['base']
-            account = self.account()
+            account = template.copy()
             account['free'] = available_balance
             account['total'] = available_balance
             result[code] = account
@@ -289,15 +421,18 @@ class swyftx(Exchange):
         if trigger:
             request['trigger'] = trigger
         path = 'orders'
-        signed = self.sign(path, 'private', 'POST', {**request, **params})
+        request.update(params)
+        signed = self.sign(path, 'private', 'POST', request)
         response = await self.fetch(signed['url'], signed['method'], signed['headers'], signed['body'])
         order = self.safe_value(response, 'order', {})
-        return self.parse_order({**order, 'orderUuid': self.safe_string(response, 'orderUuid')}, market)
+        order['orderUuid'] = self.safe_string(response, 'orderUuid')
+        return self.parse_order(order, market)
 
     async def cancel_order(self, id: str, symbol: Optional[str] = None, params={}) -> Order:
         await self.load_markets()
-        path = f"orders/{id}/"
-        signed = self.sign(path, 'private', 'DELETE', {'orderUuid': id})
+        # ids travel as params so the signer cache stays keyed by the path template
+        path = 'orders/{orderId}/'
+        signed = self.sign(path, 'private', 'DELETE', {'orderId': id, 'orderUuid': id})
         response = await self.fetch(signed['url'], signed['method'], signed['headers'], signed['body'])
         return {
             'id': id,
@@ -318,10 +453,11 @@ class swyftx(Exchange):
         }
 
     async def fetch_order(self, id: str, symbol: Optional[str] = None, params={}) -> Order:
-        await self.load_markets()
-        await self.load_asset_mapping()
-        path = f"orders/byId/{id}"
-        signed = self.sign(path, 'private', 'GET')
+        if not self._ensure_loaded_sync():
+            await self.load_markets()
+            await self.load_asset_mapping()
+        path = 'orders/byId/{orderUuid}'
+        signed = self.sign(path, 'private', 'GET', {'orderUuid': id})
         response = await self.fetch(signed['url'], signed['method'], signed['headers'], signed['body'])
         return self.parse_order(response)
 
@@ -329,15 +465,17 @@ class swyftx(Exchange):
         await self.load_markets()
         path = 'orders/'
         market = None
+        query = {}
         if symbol:
             market = self.market(symbol)
-            path += f"{market['base']}/"
-        query = {}
+            path = 'orders/{assetCode}/'
+            query['assetCode'] = market['base']
         if limit:
             query['limit'] = limit
         if 'page' in params:
             query['page'] = params.pop('page')
-        signed = self.sign(path, 'private', 'GET', {**query, **params})
+        query.update(params)
+        signed = self.sign(path, 'private', 'GET', query)
         response = await self.fetch(signed['url'], signed['method'], signed['headers'], signed['body'])
         return self.parse_orders(response, market, since, limit)
 
@@ -347,7 +485,7 @@ class swyftx(Exchange):
 
     async def fetch_closed_orders(self, symbol: Optional[str] = None, since: Optional[int] = None, limit: Optional[int] = None, params={}) -> List[Order]:
         orders = await self.fetch_orders(symbol, since, limit, params)
-        return [order for order in orders if order['status'] in ['closed', 'canceled', 'failed']]
+        return [order for order in orders if order['status'] in _CLOSED_ORDER_STATUSES]
 
     async def edit_order(self, id: str, symbol: str, type: str, side: str, amount: Optional[float] = None, price: Optional[float] = None, params={}) -> Order:
         await self.load_markets()
@@ -363,79 +501,77 @@ class swyftx(Exchange):
             request_params['quantity'] = self.amount_to_precision(symbol, amount)
             request_params['assetQuantity'] = market['base']
         path = 'orders/{orderUuid}'
-        signed = self.sign(path, 'private', 'PUT', {**request_params, **params})
+        request_params.update(params)
+        signed = self.sign(path, 'private', 'PUT', request_params)
         response = await self.fetch(signed['url'], signed['method'], signed['headers'], signed['body'])
         updated_order_uuid = self.safe_string(response, 'orderUuid')
         if not updated_order_uuid:
-            raise ExchangeError(f"{self.id} edit_order() failed to update order. Response: {json.dumps(response)}")
+            raise ExchangeError(f"{self.id} edit_order() failed to update order. Response: {self.json(response)}")
         return await self.fetch_order(updated_order_uuid, symbol)
 
     async def fetch_ticker(self, symbol: str, params={}) -> Ticker:
         await self.load_markets()
         market = self.market(symbol)
-        url = f"{self.urls['api']['public']}/live-rates/{market['quoteId']}/"
-        response = await self.fetch(url)
+        public_base = self._sync_public_urls()
+        url = f"{public_base}/live-rates/{market['quoteId']}/"
+        detail_url = f"{public_base}/markets/info/detail/{market['base']}/"
+        response, detail_info = await asyncio.gather(self.fetch(url), self.fetch(detail_url), return_exceptions=True)
+        # cancellation is a BaseException, not an Exception, and must propagate rather than be mistaken for a missing detail
+        if isinstance(response, BaseException):
+            raise response
+        if isinstance(detail_info, BaseException):
+            if not isinstance(detail_info, Exception):
+                raise detail_info
+            detail_info = {}
         rate_info = self.safe_value(response, market['baseId'])
         if not rate_info:
             raise BadRequest(f"{self.id} fetch_ticker() symbol {symbol} not found")
-        detail_url = f"{self.urls['api']['public']}/markets/info/detail/{market['base']}/"
-        detail_info = {}
-        try:
-            detail_info = await self.fetch(detail_url)
-        except Exception:
-            pass
         return self.parse_ticker({'assetId': market['baseId'], **rate_info, 'detail': detail_info}, market)
 
     async def fetch_tickers(self, symbols: Optional[List[str]] = None, params={}) -> Tickers:
         await self.load_markets()
         aud_id = '1'
-        url = f"{self.urls['api']['public']}/live-rates/{aud_id}/"
-        response = await self.fetch(url)
+        self._sync_public_urls()
+        response = await self.fetch(self._aud_live_rates_url)
+        # every market is quoted in AUD, so the requested symbols map one-to-one onto live-rates base ids
+        # an empty list means all tickers, as in filter_by_array
+        wanted_base_ids = None
+        if symbols:
+            wanted_base_ids = {self.markets[symbol]['baseId'] for symbol in symbols if symbol in self.markets}
         result = {}
         for asset_id in response.keys():
             if asset_id == aud_id:
                 continue
-            market = self.markets_by_id.get(f"{asset_id}/{aud_id}")
+            if wanted_base_ids is not None and asset_id not in wanted_base_ids:
+                continue
+            market = self._markets_by_base_id.get(asset_id)
             if not market:
                 continue
             ticker = self.parse_ticker({'assetId': asset_id, **response[asset_id]}, market)
             result[ticker['symbol']] = ticker
+        if symbols:
+            return result
         return self.filter_by_array_tickers(result, 'symbol', symbols)
 
     def parse_ticker(self, ticker: Dict, market: Optional[Market] = None) -> Ticker:
-        asset_id = self.safe_string(ticker, 'assetId')
+        # live-rates entries are flat json, so read the few populated fields directly rather than through safe_*
+        get = ticker.get
+        asset_id = _to_string(get('assetId'))
         if asset_id and market is None:
-            market = self.safe_market(f"{asset_id}/1")
-        symbol = market['symbol'] if market else None
-        mid_price = self.safe_string(ticker, 'midPrice')
-        ask = self.safe_string(ticker, 'askPrice')
-        bid = self.safe_string(ticker, 'bidPrice')
-        percentage = self.safe_string(ticker, 'dailyPriceChange')
-        detail = self.safe_value(ticker, 'detail', {})
-        volume_info = self.safe_value(detail, 'volume', {})
-        volume_24h = self.safe_string(volume_info, '24H')
-        return self.safe_ticker({
-            'symbol': symbol,
-            'timestamp': None,
-            'datetime': None,
-            'high': None,
-            'low': None,
-            'bid': bid,
-            'bidVolume': None,
-            'ask': ask,
-            'askVolume': None,
-            'vwap': None,
-            'open': None,
-            'close': mid_price,
-            'last': mid_price,
-            'previousClose': None,
-            'change': None,
-            'percentage': percentage,
-            'average': None,
-            'baseVolume': None,
-            'quoteVolume': volume_24h,
-            'info': ticker,
-        }, market)
+            market = self._markets_by_base_id.get(asset_id)
+        mid_price = _to_string(get('midPrice'))
+        detail = get('detail') or {}
+        volume_info = detail.get('volume') or {}
+        result = _TICKER_TEMPLATE.copy()
+        result['symbol'] = market['symbol'] if market else None
+        result['bid'] = _to_string(get('bidPrice'))
+        result['ask'] = _to_string(get('askPrice'))
+        result['close'] = mid_price
+        result['last'] = mid_price
+        result['percentage'] = _to_string(get('dailyPriceChange'))
+        result['quoteVolume'] = _to_string(volume_info.get('24H'))
+        result['info'] = ticker
+        return self.safe_ticker(result, market)
 
     async def fetch_ohlcv(self, symbol: str, timeframe: str = '1m', since: Optional[int] = None, limit: Optional[int] = None, params={}) -> List[OHLCV]:
         await self.load_markets()
@@ -454,12 +590,28 @@ class swyftx(Exchange):
         if limit:
             query['limit'] = limit
         path = f"charts/v2/getBars/{market['base']}/{market['quote']}/{side}/"
-        url = f"{self.urls['api']['public']}/{path}?{self.urlencode(query)}"
+        url = f"{self._sync_public_urls()}/{path}?{self.urlencode(query)}"
         response = await self.fetch(url)
         return self.parse_ohlcvs(response, market, timeframe, since, limit)
 
     def parse_ohlcvs(self, ohlcvs: List[Dict], market: Optional[Market] = None, timeframe: str = '1m', since: Optional[int] = None, limit: Optional[int] = None) -> List[OHLCV]:
-        return [self.parse_ohlcv(candle, market) for candle in ohlcvs]
+        # bars come back as flat numeric json, so read the columns directly instead of six safe_* calls per candle
+        result = []
+        append = result.append
+        to_integer = _to_integer
+        to_number = _to_number
+        number = self.number
+        for candle in ohlcvs:
+            get = candle.get
+            append([
+                to_integer(get('time')),
+                to_number(number, get('open')),
+                to_number(number, get('high')),
+                to_number(number, get('low')),
+                to_number(number, get('close')),
+                to_number(number, get('volume')),
+            ])
+        return result
 
     def parse_ohlcv(self, ohlcv: Dict, market: Optional[Market] = None) -> OHLCV:
         return [
@@ -472,55 +624,122 @@ class swyftx(Exchange):
         ]
 
     def sign(self, path, api='public', method='GET', params={}, headers=None, body=None):
-        url = f"{self.urls['api'][api]}/{self.implode_params(path, params)}"
-        query = self.omit(params, self.extract_params(path))
         if api == 'private':
             self.check_required_credentials()
-            if not self.access_token:
-                self.authenticate()
-            headers = {
-                'Content-Type': 'application/json',
-                'Authorization': f"Bearer {self.access_token}",
-                'User-Agent': f"ccxt/{self.version}",
-            }
-            if method in ['GET', 'DELETE']:
-                if query:
+        return self._signer_for(path, api, method)(params, self.access_token)
+
+    def _signer_for(self, path, api, method):
+        base_url = self.urls['api'][api]
+        key = (base_url, path, api, method)
+        signer = self._compiled_signers.get(key)
+        if signer is None:
+            signer = self._compile_signer(base_url, path, api, method)
+            self._compiled_signers[key] = signer
+        return signer
+
+    def _compile_signer(self, base_url, path, api, method):
+        prefix = f"{base_url}/"
+        param_names = frozenset(self.extract_params(path))
+        query_in_body = api == 'private' and method in ['POST', 'PUT']
+
+        def signer(params, access_token):
+            if param_names:
+                url = prefix + self.implode_params(path, params)
+                query = {k: v for k, v in params.items() if k not in param_names}
+            else:
+                url = prefix + path
+                query = params
+            body = None
+            if query:
+                if query_in_body:
+                    body = self.json(query)
+                else:
                     url += '?' + self.urlencode(query)
-            elif method in ['POST', 'PUT']:
-                if query:
-                    body = json.dumps(query)
-        else:
-            headers = {
+            return {'url': url, 'method': method, 'body': body, 'headers': self._headers_for(api, access_token)}
+
+        return signer
+
+    def _headers_for(self, api, access_token):
+        # fetch() merges into the headers it is given, so hand out copies of the cached dicts
+        if api == 'private':
+            return self._private_headers_for(access_token).copy()
+        return self._public_headers.copy()
+
+    def _private_headers_for(self, access_token):
+        # without a token the Authorization slot stays None, fetch() fills it in before the request goes out
+        authorization = f"Bearer {access_token}" if access_token is not None else None
+        if self._private_headers is None:
+            self._private_headers = {
                 'Content-Type': 'application/json',
-                'User-Agent': f"ccxt/{self.version}",
+                'Authorization': authorization,
+                'User-Agent': self._user_agent,
             }
-            if query:
-                url += '?' + self.urlencode(query)
-        return {'url': url, 'method': method, 'body': body, 'headers': headers}
+            self._private_headers_token = access_token
+        elif self._private_headers_token != access_token:
+            self._private_headers['Authorization'] = authorization
+            self._private_headers_token = access_token
+        return self._private_headers
+
+    def open(self):
+        if not (self.own_session and self.session is None):
+            return super().open()
+        # let the base class resolve the event loop and ssl context, but build the session here:
+        # every endpoint lives on api.swyftx.com.au, so keep more connections to it alive for longer
+        self.own_session = False
+        try:
+            super().open()
+        finally:
+            self.own_session = True
+        self.tcp_connector = aiohttp.TCPConnector(
+            ssl=self.ssl_context,
+            loop=self.asyncio_loop,
+            enable_cleanup_closed=True,
+            limit=self.safe_integer(self.options, 'connectionLimit', 64),
+            limit_per_host=self.safe_integer(self.options, 'connectionLimitPerHost', 32),
+            keepalive_timeout=self.safe_integer(self.options, 'keepAliveTimeout', 75),
+        )
+        self.session = aiohttp.ClientSession(loop=self.asyncio_loop, connector=self.tcp_connector, trust_env=self.aiohttp_trust_env)
 
     async def fetch(self, url, method='GET', headers=None, body=None):
-        if self.needs_authentication(url, method):
-            if not self.access_token:
-                await self.authenticate()
+        # requests signed for the private api carry an Authorization slot even when their path isn't in the endpoint table
+        signed_private = headers is not None and 'Authorization' in headers
+        if signed_private or self.needs_authentication(url, method):
+            await self._ensure_access_token()
+            if self.access_token is None:
+                raise AuthenticationError(f"{self.id} authenticate() did not return an access token")
+            if signed_private:
+                # sign() runs before the token is fetched or rotated, so stamp the current one here
+                headers['Authorization'] = self._private_headers_for(self.access_token)['Authorization']
         return await super().fetch(url, method, headers, body)
 
+    def _compile_auth_patterns(self):
+        # literal endpoints become a set lookup, templated ones one anchored alternation per HTTP method
+        literals = {}
+        patterns = {}
+        for method, endpoints in self.api.get('private', {}).items():
+            literals[method] = frozenset(endpoint.strip('/') for endpoint in endpoints if '{' not in endpoint)
+            alternatives = [re.sub(r'\\\{[^}]+\\\}', '[^/]+', re.escape(endpoint.strip('/'))) for endpoint in endpoints if '{' in endpoint]
+            patterns[method] = re.compile('^(?:' + '|'.join(alternatives) + ')/?$') if alternatives else None
+        return literals, patterns
+
     def needs_authentication(self, url: str, method: str) -> bool:
         if 'auth/refresh/' in url:
             return False
         base_url = self.urls['api']['private']
         if not url.startswith(base_url):
             return False
+        method = method.lower()
+        literals = self._auth_literals.get(method)
+        if literals is None:
+            return False
         path = url[len(base_url):].lstrip('/')
         query_index = path.find('?')
         if query_index != -1:
             path = path[:query_index]
-        private_apis = self.api.get('private', {})
-        method_endpoints = private_apis.get(method.lower(), [])
-        for endpoint in method_endpoints:
-            regex_pattern = '^' + endpoint.replace('{[^}]+}', '[^/]+') + '$'
-            if re.match(regex_pattern, path):
-                return True
-        return False
+        if (path[:-1] if path.endswith('/') else path) in literals:
+            return True
+        pattern = self._auth_patterns[method]
+        return pattern is not None and pattern.match(path) is not None
 
     def handle_errors(self, status_code, status_text, url, method, response_headers, response_body, response, request_headers, request_body):
         if not response: